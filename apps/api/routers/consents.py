@@ -68,7 +68,7 @@ def list_consents(subject_id: str | None = None, db: Session = Depends(get_db)):
     stmt = select(Consent)
     if subject_id:
         stmt = stmt.where(Consent.subject_id == subject_id)
-    return list(db.scalars(stmt).all())
+    return db.scalars(stmt).all()
 
 
 @router.post("/{consent_id}/revoke", response_model=ConsentOut)